@@ -1,14 +1,223 @@
 import pysam
 import pandas as pd
+import numpy as np
 import logging
 import os
 import argparse
-from Bio import SeqIO
-from multiprocessing import Pool, cpu_count
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
+from multiprocessing import cpu_count
+from numba import njit
 
 # Configure logging to track progress and issues
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
+# Lookup table mapping the ASCII code of a base to its column in the
+# base-specific mutation count array (A=0, T=1, C=2, G=3). Any other byte
+# (e.g. 'N') maps to the spare "other" column 4, so the hot loop can index
+# unconditionally; only columns 0-3 are reported.
+BASE_LUT = np.full(256, 4, dtype=np.uint8)
+for _lane, _base in enumerate("ATCG"):
+    BASE_LUT[ord(_base)] = _lane
+
+@njit(cache=True, nogil=True)
+def _walk_read(ref_arr, query_arr, ref_start, cigar_ops, cigar_lens, position_coverage,
+               mutation_counts, base_mutation_counts):
+    """
+    Walk one read's CIGAR operations and update the count arrays in place.
+
+    Compiled with Numba so the per-base compare/increment loop runs as machine
+    code and releases the GIL. CIGAR operations use the raw integer codes from
+    pysam (0=M, 1=I, 2=D, 4=S, 5=H).
+
+    Parameters:
+    - ref_arr (ndarray): Reference sequence as a uint8 array of ASCII codes.
+    - query_arr (ndarray): Read sequence as a uint8 array of ASCII codes.
+    - ref_start (int): 0-based reference position where the alignment starts.
+    - cigar_ops (ndarray): int32 array of CIGAR operation codes.
+    - cigar_lens (ndarray): int32 array of CIGAR operation lengths.
+    - position_coverage (ndarray): Coverage counts to update.
+    - mutation_counts (ndarray): Mutation counts to update.
+    - base_mutation_counts (ndarray): Base-specific mutation counts to update.
+    """
+    ref_pos, query_pos = ref_start, 0
+    for i in range(cigar_ops.shape[0]):
+        op = cigar_ops[i]
+        length = cigar_lens[i]
+        if op == 0:  # M: match or mismatch
+            for _ in range(length):
+                if ref_pos < ref_arr.shape[0] and query_pos < query_arr.shape[0]:
+                    position_coverage[ref_pos] += 1
+                    base = query_arr[query_pos]
+                    if base != ref_arr[ref_pos]:
+                        mutation_counts[ref_pos] += 1
+                        base_mutation_counts[ref_pos, BASE_LUT[base]] += 1
+                query_pos += 1
+                ref_pos += 1
+        elif op == 1 or op == 4 or op == 5:  # I/S/H: consume query only
+            query_pos += length
+        elif op == 2:  # D: consume reference only
+            ref_pos += length
+
+# 2-bit base codes (A=00, C=01, G=10, T=11) for the packed mismatch screen.
+# Bases outside A/C/G/T have no code of their own; reads or reference windows
+# containing them bypass the screen (see _process_full_match_batch).
+PACK_LUT = np.zeros(256, dtype=np.uint8)
+for _code, _base in enumerate("ACGT"):
+    PACK_LUT[ord(_base)] = _code
+
+def _pack_words(codes):
+    """
+    Pack rows of 2-bit base codes into uint64 words, 32 bases per word.
+
+    Parameters:
+    - codes (ndarray): uint8 matrix of 2-bit base codes whose row length is a
+      multiple of 32.
+
+    Returns:
+    - ndarray: uint64 matrix of packed words, shape (rows, length // 32).
+    """
+    words = codes.reshape(codes.shape[0], -1, 32).astype(np.uint64)
+    return np.bitwise_or.reduce(words << (2 * np.arange(32, dtype=np.uint64)), axis=2)
+
+def _packed_mismatch_totals(query_mat, ref_slices):
+    """
+    Count mismatches per read by XOR-ing 2-bit packed sequences and popcounting.
+
+    One uint64 XOR plus popcount compares 32 bases at a time: a base differs
+    exactly when its 2-bit lane has any bit set, so the lanes are collapsed
+    with (x | x >> 1) & 0x5555... before counting. Padding columns are zero in
+    both operands and never contribute.
+
+    Parameters:
+    - query_mat (ndarray): uint8 matrix of read sequences, shape (reads, length).
+    - ref_slices (ndarray): uint8 matrix of matching reference windows.
+
+    Returns:
+    - ndarray: Number of mismatching bases in each read.
+    """
+    reads, length = query_mat.shape
+    padded_length = -(-length // 32) * 32  # Ceiling to a whole number of words
+    query_codes = np.zeros((reads, padded_length), dtype=np.uint8)
+    query_codes[:, :length] = PACK_LUT[query_mat]
+    ref_codes = np.zeros((reads, padded_length), dtype=np.uint8)
+    ref_codes[:, :length] = PACK_LUT[ref_slices]
+    diff = _pack_words(query_codes) ^ _pack_words(ref_codes)
+    set_lanes = (diff | (diff >> np.uint64(1))) & np.uint64(0x5555555555555555)
+    return np.bitwise_count(set_lanes).sum(axis=1)
+
+# Compiled full-match kernels keyed by read length (see _full_match_kernel).
+_FULL_MATCH_KERNELS = {}
+
+def _full_match_kernel(length):
+    """
+    Return a mismatch-counting kernel specialized for one read length.
+
+    Sequencing runs produce a handful of fixed read lengths, so each length
+    gets its own compiled kernel that closes over the length: the inner loop
+    bound is a compile-time constant, which lets LLVM unroll and vectorize the
+    byte compares in a way a variable trip count cannot. (Numba's deprecated
+    @generated_jit used to serve this purpose; closing over the constant is
+    the supported equivalent.) Kernels are cached per process.
+
+    Parameters:
+    - length (int): Read length the kernel is specialized for.
+
+    Returns:
+    - function: Compiled kernel taking (ref_arr, query_mat, starts,
+      mutation_counts, base_mutation_counts) and counting mismatches only;
+      coverage is accumulated separately by the caller.
+    """
+    kernel = _FULL_MATCH_KERNELS.get(length)
+    if kernel is None:
+        @njit(nogil=True)
+        def kernel(ref_arr, query_mat, starts, mutation_counts, base_mutation_counts):
+            for row in range(query_mat.shape[0]):
+                start = starts[row]
+                for k in range(length):
+                    base = query_mat[row, k]
+                    if base != ref_arr[start + k]:
+                        mutation_counts[start + k] += 1
+                        base_mutation_counts[start + k, BASE_LUT[base]] += 1
+        _FULL_MATCH_KERNELS[length] = kernel
+    return kernel
+
+def _process_read_chunk(ref_arr, reads_data, counters):
+    """
+    Process a chunk of reads into one worker's count arrays.
+
+    Module-level worker for the thread pool: every input it needs is passed
+    explicitly, so tasks carry no analyzer state and the reference array is
+    shared zero-copy between threads. Each worker thread owns a private
+    struct-of-arrays counter set that it keeps accumulating into across
+    batches; the sets are reduced into the overall counters once, after the
+    whole file has been processed.
+
+    Parameters:
+    - ref_arr (ndarray): Reference sequence as a uint8 array of ASCII codes.
+    - reads_data (list): List of read data tuples for the chunk.
+    - counters (tuple): The worker's coverage, mutation count, and base
+      mutation count arrays to accumulate into.
+    """
+    ref_length = len(ref_arr)
+    position_coverage, mutation_counts, base_mutation_counts = counters
+    full_match_by_length = {}
+    for read_data in reads_data:
+        query_arr, ref_start, cigar = read_data
+        # Reads whose CIGAR is a single in-bounds "M" operation (the common
+        # case for fixed-length runs) are stacked per length and compared
+        # against the reference in one broadcasted operation per group.
+        if (cigar.shape[0] == 1 and cigar[0, 0] == 0 and cigar[0, 1] == len(query_arr)
+                and 0 <= ref_start and ref_start + len(query_arr) <= ref_length):
+            full_match_by_length.setdefault(len(query_arr), []).append((query_arr, ref_start))
+        else:
+            _walk_read(ref_arr, query_arr, ref_start, cigar[:, 0], cigar[:, 1],
+                       position_coverage, mutation_counts, base_mutation_counts)
+    for group in full_match_by_length.values():
+        query_mat = np.vstack([query_arr for query_arr, _ in group])
+        starts = np.array([ref_start for _, ref_start in group], dtype=np.int64)
+        _process_full_match_batch(ref_arr, query_mat, starts, position_coverage,
+                                  mutation_counts, base_mutation_counts)
+
+def _process_full_match_batch(ref_arr, query_mat, starts, position_coverage,
+                              mutation_counts, base_mutation_counts):
+    """
+    Process a batch of same-length, all-"M" reads with a length-specialized kernel.
+
+    Coverage for the whole batch is accumulated by summing interval
+    endpoints and taking a running total (np.add.at would loop
+    element-wise to tolerate duplicate indices). Mismatch counting runs in
+    a compiled kernel specialized for this read length, whose constant
+    inner loop bound LLVM can unroll and vectorize.
+
+    Parameters:
+    - ref_arr (ndarray): Reference sequence as a uint8 array of ASCII codes.
+    - query_mat (ndarray): uint8 matrix of read sequences, shape (reads, length).
+    - starts (ndarray): 0-based reference start position of each read.
+    - position_coverage (ndarray): Coverage counts to update.
+    - mutation_counts (ndarray): Mutation counts to update.
+    - base_mutation_counts (ndarray): Base-specific mutation counts to update.
+    """
+    length = query_mat.shape[1]
+    ref_length = len(ref_arr)
+    coverage_delta = (np.bincount(starts, minlength=ref_length + 1)
+                      - np.bincount(starts + length, minlength=ref_length + 1))
+    position_coverage += np.cumsum(coverage_delta[:ref_length])
+    # Packed popcount screen: most reads match the reference exactly and
+    # contribute coverage only, so they can skip the per-base scan. The
+    # 2-bit code space cannot represent bases outside A/C/G/T, so any read
+    # or reference window containing one is scanned unconditionally.
+    ref_slices = np.lib.stride_tricks.sliding_window_view(ref_arr, length)[starts]
+    mismatch_totals = _packed_mismatch_totals(query_mat, ref_slices)
+    unscreened = (BASE_LUT[query_mat] == 4).any(axis=1)
+    other_in_ref = np.concatenate(([0], np.cumsum(BASE_LUT[ref_arr] == 4)))
+    unscreened |= (other_in_ref[starts + length] - other_in_ref[starts]) > 0
+    detailed = (mismatch_totals > 0) | unscreened
+    if detailed.any():
+        kernel = _full_match_kernel(length)
+        kernel(ref_arr, query_mat[detailed], starts[detailed],
+               mutation_counts, base_mutation_counts)
+
 class MutationAnalyzer:
     """
     Analyzes mutation frequencies from SAM files by comparing against a reference FASTA sequence.
@@ -26,215 +235,209 @@ class MutationAnalyzer:
         - sam_file_path (str): Path to the SAM file with sequence alignments.
         - batch_size (int): Number of reads to process in each batch (default is 1000).
         """
-        self.reference_sequence = self.load_reference_sequence(fasta_file_path)
-        self.sam_file_path = sam_file_path
-        self.batch_size = batch_size
-        self.position_coverage = {}  # Track the total reads covering each position
-        self.mutation_counts = {}  # Track mutations at each position
-        self.base_mutation_counts = {}  # Track base-specific mutation counts at each position
+        self.initialize_state(self.load_reference_sequence(fasta_file_path), sam_file_path, batch_size)
 
-    def load_reference_sequence(self, fasta_file_path):
+    @classmethod
+    def from_ref_array(cls, ref_arr, sam_file_path, batch_size=1000):
         """
-        Load the reference DNA sequence from a FASTA file.
+        Create an analyzer that reuses an already-loaded reference array.
+
+        Lets several analyzers share one reference buffer instead of each
+        re-parsing the FASTA file.
 
         Parameters:
-        - fasta_file_path (str): Path to the reference FASTA file.
+        - ref_arr (ndarray): Reference sequence as a uint8 array of ASCII codes.
+        - sam_file_path (str): Path to the SAM file with sequence alignments.
+        - batch_size (int): Number of reads to process in each batch (default is 1000).
 
         Returns:
-        - str: The DNA sequence from the FASTA file.
+        - MutationAnalyzer: Analyzer backed by the shared reference array.
         """
-        logging.info(f"Loading reference sequence from {fasta_file_path}")
-        with open(fasta_file_path, "r") as fasta_file:
-            record = next(SeqIO.parse(fasta_file, "fasta"))
-            return str(record.seq)
+        analyzer = cls.__new__(cls)
+        analyzer.initialize_state(ref_arr, sam_file_path, batch_size)
+        return analyzer
 
-    @staticmethod
-    def parse_cigar(cigar_tuple):
+    def initialize_state(self, ref_arr, sam_file_path, batch_size):
         """
-        Translate CIGAR tuples to a human-readable list of operations.
+        Set the reference array, input path, and zeroed counters on the analyzer.
 
         Parameters:
-        - cigar_tuple (list of tuples): CIGAR tuples from a SAM alignment.
-
-        Returns:
-        - list of tuples: Human-readable CIGAR operations.
+        - ref_arr (ndarray): Reference sequence as a uint8 array of ASCII codes.
+        - sam_file_path (str): Path to the SAM file with sequence alignments.
+        - batch_size (int): Number of reads to process in each batch.
         """
-        cigar_ops = {0: "M", 1: "I", 2: "D", 4: "S", 5: "H"}
-        return [(cigar_ops[op], length) for op, length in cigar_tuple]
+        self.ref_arr = ref_arr
+        self.sam_file_path = sam_file_path
+        self.batch_size = batch_size
+        ref_length = len(ref_arr)
+        self.position_coverage = np.zeros(ref_length, dtype=np.int64)  # Total reads covering each position
+        self.mutation_counts = np.zeros(ref_length, dtype=np.int64)  # Mutations at each position
+        self.base_mutation_counts = np.zeros((ref_length, 5), dtype=np.int64)  # Base-specific mutation counts
 
-    def process_read_data(self, read_data):
+    @staticmethod
+    def load_reference_sequence(fasta_file_path):
         """
-        Process individual read data to update coverage and mutation information.
-
-        Parameters:
-        - read_data (tuple): A tuple containing the read's query sequence, start position,
-          CIGAR operations, and query name.
+        Load the reference DNA sequence from an indexed FASTA file.
 
-        Returns:
-        - tuple: Coverage, mutation counts, and base mutation counts dictionaries for the read.
-        """
-        query_sequence, ref_start, cigar_tuples, _ = read_data
-        if query_sequence is None or cigar_tuples is None:
-            return {}, {}, {}
-
-        local_position_coverage = {}
-        local_mutation_counts = {}
-        local_base_mutation_counts = {}
-        ref_pos, query_pos = ref_start, 0
-        cigar = self.parse_cigar(cigar_tuples)
-
-        for operation, length in cigar:
-            query_pos, ref_pos = self.handle_cigar_operation(
-                operation, length, ref_pos, query_pos, query_sequence,
-                local_position_coverage, local_mutation_counts, local_base_mutation_counts
-            )
-
-        return local_position_coverage, local_mutation_counts, local_base_mutation_counts
-
-    def handle_cigar_operation(self, operation, length, ref_pos, query_pos, query_sequence,
-                               local_position_coverage, local_mutation_counts, local_base_mutation_counts):
-        """
-        Handle individual CIGAR operation to update position and mutation counts.
+        Uses pysam's faidx-backed accessor, which reads just the first record's
+        bytes instead of parsing the whole file; the sequence is kept only as
+        raw ASCII codes, so reads can be compared with vectorized operations.
 
         Parameters:
-        - operation (str): The CIGAR operation (e.g., "M" for match/mismatch).
-        - length (int): Length of the operation.
-        - ref_pos (int): Current reference position.
-        - query_pos (int): Current query position.
-        - query_sequence (str): The sequence of the read.
-        - local_position_coverage (dict): Coverage dictionary for the current read batch.
-        - local_mutation_counts (dict): Mutation count dictionary for the current read batch.
-        - local_base_mutation_counts (dict): Base-specific mutation count dictionary for the current read batch.
+        - fasta_file_path (str): Path to the reference FASTA file. A .fai index
+          is created next to it if one does not already exist.
 
         Returns:
-        - tuple: Updated query and reference positions.
+        - ndarray: The DNA sequence as a uint8 array of ASCII codes.
         """
-        if operation == "M":
-            for _ in range(length):
-                if ref_pos < len(self.reference_sequence) and query_pos < len(query_sequence):
-                    self.update_mutation_data(
-                        ref_pos, query_sequence[query_pos], local_position_coverage,
-                        local_mutation_counts, local_base_mutation_counts
-                    )
-                query_pos += 1
-                ref_pos += 1
-        elif operation in ["I", "S", "H"]:
-            query_pos += length
-        elif operation == "D":
-            ref_pos += length
-        return query_pos, ref_pos
+        logging.info(f"Loading reference sequence from {fasta_file_path}")
+        with pysam.FastaFile(fasta_file_path) as fasta_file:
+            sequence = fasta_file.fetch(fasta_file.references[0])
+        return np.frombuffer(sequence.encode('ascii'), dtype=np.uint8)
 
-    def update_mutation_data(self, ref_pos, query_base, local_position_coverage,
-                             local_mutation_counts, local_base_mutation_counts):
+    def merge_results(self, counters):
         """
-        Update coverage and mutation data for a specific base at a given position.
+        Accumulate one worker's count arrays into the overall counters.
 
         Parameters:
-        - ref_pos (int): The reference position being updated.
-        - query_base (str): The base in the query sequence at ref_pos.
-        - local_position_coverage (dict): Coverage dictionary for the current read batch.
-        - local_mutation_counts (dict): Mutation count dictionary for the current read batch.
-        - local_base_mutation_counts (dict): Base-specific mutation count dictionary for the current read batch.
+        - counters (tuple): A worker's coverage, mutation count, and base
+          mutation count arrays.
         """
-        local_position_coverage[ref_pos + 1] = local_position_coverage.get(ref_pos + 1, 0) + 1
-        if query_base != self.reference_sequence[ref_pos]:
-            self.increment_mutation_counts(ref_pos, query_base, local_mutation_counts, local_base_mutation_counts)
+        self.position_coverage += counters[0]
+        self.mutation_counts += counters[1]
+        self.base_mutation_counts += counters[2]
 
-    def increment_mutation_counts(self, ref_pos, query_base, local_mutation_counts, local_base_mutation_counts):
+    def process_large_dataset(self):
         """
-        Increment mutation counts and base-specific mutation counts for a given position.
+        Process the entire alignment file for mutation analysis.
 
-        Parameters:
-        - ref_pos (int): The reference position being updated.
-        - query_base (str): The base in the query sequence at ref_pos.
-        - local_mutation_counts (dict): Mutation count dictionary for the current read batch.
-        - local_base_mutation_counts (dict): Base-specific mutation count dictionary for the current read batch.
+        Uses a thread pool to process read data in parallel: the Numba kernel
+        releases the GIL, so threads share the reference and count arrays
+        without any pickling or inter-process copies. Indexed BAM input is
+        split into reference tiles fetched in parallel; unindexed input (text
+        SAM) is streamed linearly and processed in batches.
         """
-        position = ref_pos + 1
-        local_mutation_counts[position] = local_mutation_counts.get(position, 0) + 1
-        local_base_mutation_counts.setdefault(position, {'A': 0, 'T': 0, 'C': 0, 'G': 0})
-        local_base_mutation_counts[position][query_base] += 1
+        ref_length = len(self.ref_arr)
+        # One private counter set per worker, reused across every batch; the
+        # single reduction below replaces a per-batch merge on the main thread.
+        worker_counters = [(np.zeros(ref_length, dtype=np.int64),
+                            np.zeros(ref_length, dtype=np.int64),
+                            np.zeros((ref_length, 5), dtype=np.int64))
+                           for _ in range(cpu_count())]
+        # "rb" requests the binary BAM path; htslib still auto-detects and
+        # accepts text SAM input, so existing SAM pipelines keep working.
+        with pysam.AlignmentFile(self.sam_file_path, "rb") as samfile, \
+                ThreadPoolExecutor(max_workers=len(worker_counters)) as executor:
+            if samfile.has_index():
+                logging.info(f"Index found; processing {len(worker_counters)} reference tiles in parallel")
+                contig = samfile.references[0]
+                bounds = np.linspace(0, ref_length, len(worker_counters) + 1).astype(np.int64)
+                list(executor.map(self.process_tile, [contig] * len(worker_counters),
+                                  bounds[:-1], bounds[1:], worker_counters))
+            else:
+                self.process_streamed(samfile, executor, worker_counters)
+        for counters in worker_counters:
+            self.merge_results(counters)
+        logging.info("Finished processing all batches")
 
-    def merge_results(self, batch_results):
+    def process_tile(self, contig, tile_start, tile_end, counters):
         """
-        Accumulate batch results into overall coverage and mutation counts.
+        Process every read starting within one reference tile.
+
+        Opens a private handle on the indexed BAM so tiles can be fetched
+        concurrently. Reads overlapping a tile boundary are returned by the
+        fetches of both tiles; only the tile containing the read's start
+        position counts it.
 
         Parameters:
-        - batch_results (tuple): Tuple of dictionaries from process_read_data.
+        - contig (str): Reference name to fetch from.
+        - tile_start (int): 0-based inclusive start of the tile.
+        - tile_end (int): 0-based exclusive end of the tile.
+        - counters (tuple): The worker's count arrays to accumulate into.
         """
-        for pos, count in batch_results[0].items():
-            self.position_coverage[pos] = self.position_coverage.get(pos, 0) + count
-        for pos, count in batch_results[1].items():
-            self.mutation_counts[pos] = self.mutation_counts.get(pos, 0) + count
-        for pos, base_counts in batch_results[2].items():
-            if pos not in self.base_mutation_counts:
-                self.base_mutation_counts[pos] = {'A': 0, 'T': 0, 'C': 0, 'G': 0}
-            for base, base_count in base_counts.items():
-                self.base_mutation_counts[pos][base] += base_count
+        reads_data = []
+        with pysam.AlignmentFile(self.sam_file_path, "rb") as samfile:
+            for read in samfile.fetch(contig, tile_start, tile_end):
+                if read.reference_start < tile_start:
+                    continue
+                if read.query_sequence is None or read.cigartuples is None:
+                    continue
+                reads_data.append((np.frombuffer(read.query_sequence.encode('ascii'), dtype=np.uint8),
+                                   read.reference_start, np.asarray(read.cigartuples, dtype=np.int32)))
+                if len(reads_data) >= self.batch_size:
+                    _process_read_chunk(self.ref_arr, reads_data, counters)
+                    reads_data = []
+        if reads_data:
+            _process_read_chunk(self.ref_arr, reads_data, counters)
 
-    def process_large_dataset(self):
+    def process_streamed(self, samfile, executor, worker_counters):
         """
-        Process the entire SAM file in batches for mutation analysis.
+        Stream an unindexed alignment file linearly and process it in batches.
 
-        Uses multiprocessing to process read data in parallel.
+        Parameters:
+        - samfile (AlignmentFile): Open alignment file to iterate.
+        - executor (ThreadPoolExecutor): Thread pool for parallel processing.
+        - worker_counters (list): Per-worker count array sets to accumulate into.
         """
         logging.info(f"Processing SAM file in batches of {self.batch_size}")
         batch_number, reads_data = 1, []
-        with pysam.AlignmentFile(self.sam_file_path, "r") as samfile, Pool(cpu_count()) as pool:
-            for read in samfile:
-                reads_data.append((read.query_sequence, read.reference_start, read.cigartuples, read.query_name))
-                if len(reads_data) >= self.batch_size:
-                    self.process_batch(pool, reads_data, batch_number)
-                    reads_data = []
-                    batch_number += 1
-            if reads_data:
-                self.process_batch(pool, reads_data, batch_number)
-        logging.info("Finished processing all batches")
-
-    def process_batch(self, pool, reads_data, batch_number):
+        for read in samfile:
+            if read.query_sequence is None or read.cigartuples is None:
+                continue
+            reads_data.append((np.frombuffer(read.query_sequence.encode('ascii'), dtype=np.uint8),
+                               read.reference_start, np.asarray(read.cigartuples, dtype=np.int32)))
+            if len(reads_data) >= self.batch_size:
+                self.process_batch(executor, reads_data, batch_number, worker_counters)
+                reads_data = []
+                batch_number += 1
+        if reads_data:
+            self.process_batch(executor, reads_data, batch_number, worker_counters)
+
+    def process_batch(self, executor, reads_data, batch_number, worker_counters):
         """
-        Process a single batch of reads and merge the results.
+        Process a single batch of reads across the worker counter sets.
+
+        Each chunk of the batch is paired with one counter set, so no two
+        threads ever write to the same arrays within a batch.
 
         Parameters:
-        - pool (Pool): Multiprocessing pool for parallel processing.
+        - executor (ThreadPoolExecutor): Thread pool for parallel processing.
         - reads_data (list): List of read data for the batch.
         - batch_number (int): The current batch number.
+        - worker_counters (list): Per-worker count array sets to accumulate into.
         """
         logging.info(f"Processing batch {batch_number} with {len(reads_data)} reads")
-        results = pool.map(self.process_read_data, reads_data)
-        for batch_results in results:
-            self.merge_results(batch_results)
+        chunk_size = -(-len(reads_data) // len(worker_counters))  # Ceiling division
+        chunks = [reads_data[start:start + chunk_size] for start in range(0, len(reads_data), chunk_size)]
+        # Exhaust the iterator so the batch is fully processed (and the counter
+        # sets are free again) before the next batch is dispatched.
+        list(executor.map(_process_read_chunk, repeat(self.ref_arr), chunks, worker_counters))
 
     def calculate_mutation_frequencies(self):
         """
         Calculate mutation frequencies as percentages for each position.
 
+        Each column is produced by one vectorized divide over the count arrays;
+        positions with no coverage report 0.
+
         Returns:
-        - dict: A dictionary where each position maps to a dictionary of total and base-specific percentages.
+        - dict: A dictionary mapping each output column ('Template_Base', 'Total',
+          'A', 'T', 'C', 'G') to its full per-position column; numeric columns
+          are float64 arrays so downstream math can operate on whole columns.
         """
         logging.info("Calculating mutation frequencies")
-        mutation_frequencies = {}
-        for pos in range(1, len(self.reference_sequence) + 1):
-            mutation_frequencies[pos] = self.get_base_mutation_percentages(pos)
-        return mutation_frequencies
-
-    def get_base_mutation_percentages(self, pos):
-        """
-        Calculate mutation percentage for each base at a given position.
+        coverage = self.position_coverage
+        covered = coverage > 0
 
-        Parameters:
-        - pos (int): Position in the reference sequence.
+        def percentages(counts):
+            return np.divide(counts * 100.0, coverage, out=np.zeros(len(coverage)), where=covered)
 
-        Returns:
-        - dict: A dictionary with the template base, total mutation percentage, and percentages for each base.
-        """
-        total_reads = self.position_coverage.get(pos, 0)
-        mutations = self.mutation_counts.get(pos, 0)
-        overall_percentage = (mutations / total_reads) * 100 if total_reads > 0 else 0
-        base_percentages = {base: (self.base_mutation_counts.get(pos, {}).get(base, 0) / total_reads) * 100
-                            if total_reads > 0 else 0 for base in ['A', 'T', 'C', 'G']}
-        template_base = self.reference_sequence[pos - 1]  # Retrieve template base
-        return {'Template_Base': template_base, 'Total': overall_percentage, **base_percentages}
+        return {'Template_Base': self.ref_arr.view('S1').astype('U1'),
+                'Total': percentages(self.mutation_counts),
+                'A': percentages(self.base_mutation_counts[:, 0]),
+                'T': percentages(self.base_mutation_counts[:, 1]),
+                'C': percentages(self.base_mutation_counts[:, 2]),
+                'G': percentages(self.base_mutation_counts[:, 3])}
 
     @staticmethod
     def save_to_csv(data, filename):
@@ -246,9 +449,12 @@ class MutationAnalyzer:
         - filename (str): Path to save the CSV file.
         """
         logging.info(f"Saving data to {filename}")
-        df = pd.DataFrame(data).T
-        df.index.name = 'Position'
-        df.to_csv(filename)
+        # Build the frame column by column: constructing from whole columns is
+        # O(positions), unlike transposing a dict-of-dicts, which converts and
+        # type-infers every cell individually.
+        length = len(next(iter(data.values())))
+        columns = {'Position': np.arange(1, length + 1), **data}
+        pd.DataFrame(columns).to_csv(filename, index=False)
         logging.info("Data saved successfully")
 
     @staticmethod
@@ -256,36 +462,21 @@ class MutationAnalyzer:
         """
         Calculate enrichment by subtracting mutation percentages between two datasets.
 
+        With columnar frequencies this is one vectorized subtraction per column;
+        the template bases are carried over from dataset 1.
+
         Parameters:
-        - frequencies1 (dict): Mutation frequencies for dataset 1.
-        - frequencies2 (dict): Mutation frequencies for dataset 2.
+        - frequencies1 (dict): Columnar mutation frequencies for dataset 1.
+        - frequencies2 (dict): Columnar mutation frequencies for dataset 2.
 
         Returns:
-        - dict: Enrichment values for each position.
+        - dict: Enrichment columns keyed like the frequency columns.
         """
-        enrichment = {}
-        for pos in frequencies1:
-            enrichment[pos] = {key: frequencies1[pos].get(key, 0) - frequencies2[pos].get(key, 0)
-                               for key in frequencies1[pos] if key != 'Template_Base'}
-            enrichment[pos]['Template_Base'] = frequencies1[pos].get('Template_Base', '')
+        enrichment = {key: frequencies1[key] - frequencies2[key]
+                      for key in frequencies1 if key != 'Template_Base'}
+        enrichment['Template_Base'] = frequencies1['Template_Base']
         return enrichment
 
-def setup_analyzer(reference, sam_file, batch_size):
-    """
-    Set up and execute the mutation analysis for a given reference and SAM file.
-
-    Parameters:
-    - reference (str): Path to the reference FASTA file.
-    - sam_file (str): Path to the SAM file.
-    - batch_size (int): Size of read batches to process.
-
-    Returns:
-    - dict: Mutation frequencies calculated by the analyzer.
-    """
-    analyzer = MutationAnalyzer(reference, sam_file, batch_size)
-    analyzer.process_large_dataset()
-    return analyzer.calculate_mutation_frequencies()
-
 def save_frequencies(data, results_dir, filename):
     """
     Save mutation frequencies to a CSV file in the specified directory.
@@ -308,13 +499,22 @@ def run_analysis(reference, sam1, sam2, results_dir, batch_size=1000):
     - results_dir (str): Directory to save output files.
     - batch_size (int): Size of read batches to process.
     """
-    analyzer1 = setup_analyzer(reference, sam1, batch_size)
-    save_frequencies(analyzer1, results_dir, 'mutation_frequencies_dataset1.csv')
+    ref_arr = MutationAnalyzer.load_reference_sequence(reference)
+    analyzer1 = MutationAnalyzer.from_ref_array(ref_arr, sam1, batch_size)
+    analyzer2 = MutationAnalyzer.from_ref_array(ref_arr, sam2, batch_size)
+
+    # The datasets bottleneck on alignment-file I/O, so processing both at
+    # once overlaps reading one file with computing on the other.
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        list(executor.map(MutationAnalyzer.process_large_dataset, (analyzer1, analyzer2)))
+
+    frequencies1 = analyzer1.calculate_mutation_frequencies()
+    save_frequencies(frequencies1, results_dir, 'mutation_frequencies_dataset1.csv')
 
-    analyzer2 = setup_analyzer(reference, sam2, batch_size)
-    save_frequencies(analyzer2, results_dir, 'mutation_frequencies_dataset2.csv')
+    frequencies2 = analyzer2.calculate_mutation_frequencies()
+    save_frequencies(frequencies2, results_dir, 'mutation_frequencies_dataset2.csv')
 
-    enrichment = MutationAnalyzer.calculate_enrichment(analyzer1, analyzer2)
+    enrichment = MutationAnalyzer.calculate_enrichment(frequencies1, frequencies2)
     save_frequencies(enrichment, results_dir, 'mutation_enrichment.csv')
 
 def main():
@@ -42,7 +42,26 @@ run_minimap() {
 run_minimap "$REFERENCE_FILE" "$FASTA_FILE_1" "$SAM_FILE_1"
 run_minimap "$REFERENCE_FILE" "$FASTA_FILE_2" "$SAM_FILE_2"
 
-# Step 3: Run MutationAnalyzer in the virtual environment with RESULTS_DIR
+# Step 3: Sort and index the alignments so MutationAnalyzer can fetch
+# reference tiles in parallel instead of streaming text SAM on one thread
+echo "Sorting and indexing alignments..."
+
+sort_and_index() {
+    local sam_file=$1
+    local bam_file=$2
+
+    if "$SAMTOOLS" sort -o "$bam_file" "$sam_file" && "$SAMTOOLS" index "$bam_file"; then
+        echo "Sorted and indexed $sam_file to $bam_file"
+    else
+        echo "Error sorting/indexing $sam_file."
+        exit 1
+    fi
+}
+
+sort_and_index "$SAM_FILE_1" "$SORTED_BAM_1"
+sort_and_index "$SAM_FILE_2" "$SORTED_BAM_2"
+
+# Step 4: Run MutationAnalyzer in the virtual environment with RESULTS_DIR
 echo "Running MutationAnalyzer..."
 
 source "$VENV_DIR/bin/activate"
@@ -52,9 +71,9 @@ MUTATION_FREQ_DATASET1="$RESULTS_DIR/mutation_frequencies_dataset1.csv"
 MUTATION_FREQ_DATASET2="$RESULTS_DIR/mutation_frequencies_dataset2.csv"
 MUTATION_ENRICHMENT="$RESULTS_DIR/mutation_enrichment.csv"
 
-python3 "$SCRIPTS_DIR/MutationAnalyzer.py" --reference "$REFERENCE_FILE" --sam1 "$SAM_FILE_1" --sam2 "$SAM_FILE_2" --results_dir "$RESULTS_DIR"
+python3 "$SCRIPTS_DIR/MutationAnalyzer.py" --reference "$REFERENCE_FILE" --sam1 "$SORTED_BAM_1" --sam2 "$SORTED_BAM_2" --results_dir "$RESULTS_DIR"
 
-# Step 4: Run Plotting Script with specific files
+# Step 5: Run Plotting Script with specific files
 echo "Running Plotting Script..."
 
 python3 "$SCRIPTS_DIR/plot_results.py" --dataset1 "$MUTATION_FREQ_DATASET1" --dataset2 "$MUTATION_FREQ_DATASET2" --enrichment "$MUTATION_ENRICHMENT"